@@ -1,14 +1,62 @@
+import json
+import queue
+import re
+
 import vosk
 import sounddevice as sd
 
+# The small English model is plenty for the fixed command grammar and decodes
+# far faster than the full-size model
+MODEL_PATH = "vosk-model-small-en-us-0.15"
+SAMPLE_RATE = 16000
+BLOCK_SIZE = 480  # 30 ms at 16 kHz, Vosk's frame size
+
+# Restrict decoding to the words a clip command can contain ("clip the last
+# thirty seconds"); anything else is matched as [unk]
+NUMBER_WORDS = [
+    "one", "two", "three", "four", "five", "six", "seven", "eight", "nine",
+    "ten", "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen",
+    "seventeen", "eighteen", "nineteen", "twenty", "thirty", "forty",
+    "fifty", "sixty",
+]
+COMMAND_WORDS = ["clip", "the", "last", "second", "seconds"] + NUMBER_WORDS
+GRAMMAR = json.dumps(COMMAND_WORDS + ["[unk]"])
+CLIP_PATTERN = re.compile(r"\bclip\b")
+
+_recognizer = None
+
+def _get_recognizer():
+    # Loading the model and building the recognizer is by far the most
+    # expensive step, so do it once and reuse it across calls
+    global _recognizer
+    if _recognizer is None:
+        model = vosk.Model(MODEL_PATH)
+        _recognizer = vosk.KaldiRecognizer(model, SAMPLE_RATE, GRAMMAR)
+    return _recognizer
+
+def warmup():
+    # Load the model and push a little silence through the decoder at startup
+    # so the first real command doesn't pay for graph setup
+    recognizer = _get_recognizer()
+    recognizer.AcceptWaveform(b"\x00" * 3200)
+    recognizer.Reset()
+
 def recognize_voice_command():
-    model = vosk.Model("path_to_vosk_model")
-    recognizer = vosk.KaldiRecognizer(model, 16000)
-    with sd.InputStream(samplerate=16000, channels=1) as stream:
+    recognizer = _get_recognizer()
+    recognizer.Reset()
+    audio_queue = queue.Queue()
+
+    # Capture runs in PortAudio's callback thread and only hands raw int16
+    # blocks over; decoding stays on this thread
+    def callback(indata, frames, time, status):
+        audio_queue.put(bytes(indata))
+
+    with sd.RawInputStream(samplerate=SAMPLE_RATE, blocksize=BLOCK_SIZE,
+                           dtype="int16", channels=1, callback=callback):
         while True:
-            data = stream.read(4000)
+            data = audio_queue.get()
             if recognizer.AcceptWaveform(data):
-                result = recognizer.Result()
-                if "clip" in result:
+                text = json.loads(recognizer.Result()).get("text", "")
+                if CLIP_PATTERN.search(text):
                     # Extract time (e.g., 30 seconds) and call clipping function
-                    return process_command(result)
+                    return process_command(text)